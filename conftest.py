@@ -1,13 +1,18 @@
 """
 Fixtures for the documentation tests and examples.
 """
+import io
+import mmap
 import os
 import re
+import shlex
 import subprocess
+import uuid
+import weakref
 from doctest import ELLIPSIS
 from pathlib import Path
 from textwrap import dedent
-from typing import Iterable, Iterator, Optional, Tuple, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import pytest
 import sybil
@@ -15,6 +20,7 @@ import sybil.evaluators.doctest
 import sybil.evaluators.python
 import sybil.parsers.abstract
 import sybil.parsers.abstract.lexers
+import sybil.parsers.markdown.lexers
 import sybil.parsers.myst
 import sybil.parsers.myst.lexers
 import sybil.parsers.rest
@@ -23,7 +29,93 @@ import sybil.region
 import sybil.typing
 
 
-class CodeFileParser(sybil.parsers.myst.CodeBlockParser):
+# The lexers are the same as in "sybil.parsers.myst.CodeBlockParser", but that class
+# creates (and compiles) new ones for each parser instance.  They don't hold any state,
+# so we create them once and share them between all our code block parsers.
+CODE_BLOCK_LEXERS = sybil.parsers.abstract.lexers.LexerCollection(
+    [
+        sybil.parsers.markdown.lexers.FencedCodeBlockLexer(
+            language=r".+",
+            mapping={"language": "arguments", "source": "source"},
+        ),
+        sybil.parsers.myst.lexers.DirectiveLexer(
+            directive="code-block",
+            arguments=".+",
+        ),
+        sybil.parsers.myst.lexers.DirectiveInPercentCommentLexer(
+            directive=r"(invisible-)?code(-block)?",
+            arguments=".+",
+        ),
+        sybil.parsers.markdown.lexers.DirectiveInHTMLCommentLexer(
+            directive=r"(invisible-)?code(-block)?",
+            arguments=".+",
+        ),
+    ]
+)
+
+
+# All code block parsers use the same lexers, so each document only needs to be lexed
+# once.  The lexed regions are grouped by their language.
+LexedRegions = Dict[str, List[sybil.Region]]
+_LEXED_DOCUMENTS: "weakref.WeakKeyDictionary[sybil.Document, LexedRegions]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _lex_code_blocks(document: sybil.Document) -> LexedRegions:
+    """
+    Return the code blocks of *document* grouped by language.
+    """
+    try:
+        return _LEXED_DOCUMENTS[document]
+    except KeyError:
+        regions: LexedRegions = {}
+        for region in CODE_BLOCK_LEXERS(document):
+            regions.setdefault(region.lexemes["arguments"], []).append(region)
+        _LEXED_DOCUMENTS[document] = regions
+        return regions
+
+
+def _dedented(region: sybil.Region) -> str:
+    """
+    Return the dedented source of *region*.
+
+    The result is cached in the region's lexemes, so it is only computed once.
+    """
+    try:
+        return region.lexemes["dedented_source"]
+    except KeyError:
+        source = region.lexemes["dedented_source"] = dedent(region.parsed)
+        return source
+
+
+class CodeBlockParser(sybil.parsers.abstract.AbstractCodeBlockParser):
+    """
+    Base class for our code block parsers.  Uses the shared :data:`CODE_BLOCK_LEXERS`.
+    """
+
+    def __init__(
+        self,
+        language: Optional[str] = None,
+        evaluator: Optional[sybil.typing.Evaluator] = None,
+    ) -> None:
+        super().__init__(CODE_BLOCK_LEXERS, language, evaluator)
+
+    def __call__(self, document: sybil.Document) -> Iterable[sybil.Region]:
+        # Like the base class, but the document is only lexed once for all parsers.
+        # Each parser gets its own region objects, because it modifies them.
+        evaluator = self._evaluator or self.evaluate
+        for lexed in _lex_code_blocks(document).get(self.language, ()):
+            yield sybil.Region(
+                lexed.start,
+                lexed.end,
+                lexed.lexemes["source"],
+                evaluator,
+                lexed.lexemes,
+            )
+
+
+class CodeFileParser(CodeBlockParser):
     """
     Parser for included/referenced files.
     """
@@ -38,7 +130,7 @@ class CodeFileParser(sybil.parsers.myst.CodeBlockParser):
         fallback_evaluator: Optional[sybil.typing.Evaluator] = None,
         doctest_optionflags: int = 0,
     ) -> None:
-        super().__init__(language=language)  # type: ignore[arg-type]
+        super().__init__(language)
         if ext is not None:
             self.ext = ext
         if self.ext is None:
@@ -54,11 +146,16 @@ class CodeFileParser(sybil.parsers.myst.CodeBlockParser):
             )
 
     def __call__(self, document: sybil.Document) -> Iterable[sybil.Region]:
+        doctest_parser = self.doctest_parser
+        if doctest_parser is None:
+            yield from super().__call__(document)
+            return
+
         for region in super().__call__(document):
             # Doctests in a normal "```python" block
             source = region.parsed
-            if self.language == "python" and source.startswith(">>>"):
-                for doctest_region in self.doctest_parser(source, document.path):  # type: ignore
+            if source.startswith(">>>"):
+                for doctest_region in doctest_parser(source, document.path):
                     doctest_region.adjust(region, source)
                     yield doctest_region
             else:
@@ -67,13 +164,13 @@ class CodeFileParser(sybil.parsers.myst.CodeBlockParser):
     def evaluate(self, example: sybil.Example) -> None:
         caption = example.region.lexemes.get("options", {}).get("caption")
         if caption and caption.endswith(self.ext):
-            raw_text = dedent(example.parsed)
-            Path(caption).write_text(raw_text)
+            raw_text = _dedented(example.region)
+            Path(caption).write_bytes(raw_text.encode())
         elif self.evaluator is not None:
             self.evaluator(example)
 
 
-class ConsoleCodeBlockParser(sybil.parsers.myst.CodeBlockParser):
+class ConsoleCodeBlockParser(CodeBlockParser):
     """
     Code block parser for Console sessions.
 
@@ -87,24 +184,20 @@ class ConsoleCodeBlockParser(sybil.parsers.myst.CodeBlockParser):
 
         expected: Union[str, re.Pattern]
         if "..." in output:
-            output = re.escape(output).replace("\\.\\.\\.", ".*")
-            expected = re.compile(f"^{output}$", flags=re.DOTALL)
+            expected = _get_expected_re(output)
         else:
             expected = output
-        proc = subprocess.Popen(
-            ["bash"],  # noqa: S603, S607
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-        )
-        stdout, _stderr = proc.communicate(cmds)
+        bash: BashSession = example.namespace["bash_session"]
+        returncode, stdout = bash.run(cmds)
         # Remove trailing spaces in output:
-        stdout = "".join(f"{line.rstrip()}\n" for line in stdout.splitlines())
+        lines = [line.rstrip() for line in stdout.splitlines()]
+        stdout = "\n".join(lines) + "\n" if lines else ""
+        # Some examples show failing commands, so the exit code is only informational:
+        msg = f"Exit code: {returncode}"
         if isinstance(expected, str):
-            assert stdout == expected
+            assert stdout == expected, msg
         else:
-            assert expected.match(stdout)
+            assert expected.match(stdout), msg
 
     def _get_commands(self, example: sybil.Example) -> Tuple[str, str]:
         """
@@ -118,19 +211,43 @@ class ConsoleCodeBlockParser(sybil.parsers.myst.CodeBlockParser):
         # Now we just concatenate all commands and run them as a single script and
         # compare the output of all commands at once.  It's not very easy to simulate an
         # interactive Bash session in Python and this is good enough for the doctests.
-        code_lines = dedent(example.parsed).strip().splitlines()
+        code_lines = _dedented(example.region).strip().splitlines()
 
-        cmds, output = [], []
+        cmds, output = io.StringIO(), io.StringIO()
         for line in code_lines:
             if line.startswith("$"):
-                _, _, current_cmd = line.partition(" ")
-                cmds.append(current_cmd)
+                cmds.write(line.partition(" ")[2])
+                cmds.write("\n")
             else:
-                output.append(line)
+                output.write(line)
+                output.write("\n")
+
+        cmds.write("exit\n")
+
+        return cmds.getvalue(), output.getvalue()
+
+
+# Many console examples have the same (or a similar) expected output, e.g.
+# "usage: ...", so we cache the compiled patterns:
+_EXPECTED_RE_CACHE: Dict[str, re.Pattern] = {}
+
+
+def _get_expected_re(output: str) -> re.Pattern:
+    """
+    Return a pattern that matches *output* with "..." as wildcard.
+    """
+    try:
+        return _EXPECTED_RE_CACHE[output]
+    except KeyError:
+        pattern = re.escape(output).replace("\\.\\.\\.", ".*")
+        expected = _EXPECTED_RE_CACHE[output] = re.compile(
+            f"^{pattern}$", flags=re.DOTALL
+        )
+        return expected
 
-        cmds.append("exit")
 
-        return "".join(f"{c}\n" for c in cmds), "".join(f"{o}\n" for o in output)
+# Env vars whose names are no valid shell identifiers can't be exported by Bash:
+_SHELL_NAME_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
 
 
 @pytest.fixture(scope="module")
@@ -144,14 +261,102 @@ def tempdir(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
     path = f"{tests_dir}:{path}"
 
     tmp_path = tmp_path_factory.mktemp("doctests")
-    old_cwd = os.getcwd()
-    os.chdir(tmp_path)
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setitem(os.environ, "PATH", path)
+        yield tmp_path
+
+
+class BashSession:
+    """
+    A long running Bash process that is shared by all console blocks of a document.
+
+    Starting a new shell for each code block is much slower than running the commands
+    in a subshell of an existing one.  The subshell also makes sure that "export" or
+    "cd" in one code block don't leak into the next one.
+    """
+
+    def __init__(self) -> None:
+        self._env = dict(os.environ)
+        self._sentinel = f"__SYBIL_END_{uuid.uuid4().hex}"
+        self._sentinel_re = re.compile(rf"{self._sentinel}_(\d+)__\n$")
+        self._proc = subprocess.Popen(
+            ["bash"],  # noqa: S603, S607
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+
+    def run(self, cmds: str) -> Tuple[int, str]:
+        """
+        Run *cmds* in a subshell and return its exit code and the combined stdout and
+        stderr.
+        """
+        assert self._proc.stdin is not None and self._proc.stdout is not None
+        env_changes = self._get_env_changes()
+        self._proc.stdin.write(
+            f"(\n{env_changes}{cmds}) </dev/null 2>&1\n"
+            f"printf '%s_%d__\\n' {self._sentinel} $?\n"
+        )
+        self._proc.stdin.flush()
+        lines = []
+        while True:
+            line = self._proc.stdout.readline()
+            if not line:
+                raise RuntimeError("The Bash session died unexpectedly")
+            match = self._sentinel_re.search(line)
+            if match:
+                # The output may not end with a newline, so the sentinel is not
+                # necessarily on a line of its own.
+                lines.append(line[: match.start()])
+                return int(match.group(1)), "".join(lines)
+            lines.append(line)
+
+    def close(self) -> None:
+        """
+        Terminate the Bash process.
+        """
+        if self._proc.stdin is not None:
+            self._proc.stdin.close()
+        self._proc.wait()
+        if self._proc.stdout is not None:
+            self._proc.stdout.close()
+
+    def _get_env_changes(self) -> str:
+        """
+        Return commands that apply changes to :data:`os.environ` since the session was
+        started (a freshly started shell would also see them).
+        """
+        current: Dict[str, str] = dict(os.environ)
+        if current == self._env:
+            return ""
+        cmds = [
+            f"export {k}={shlex.quote(v)}\n"
+            for k, v in current.items()
+            if self._env.get(k) != v and _SHELL_NAME_RE.fullmatch(k)
+        ]
+        cmds.extend(
+            f"unset {k}\n"
+            for k in self._env
+            if k not in current and _SHELL_NAME_RE.fullmatch(k)
+        )
+        return "".join(cmds)
+
+
+@pytest.fixture(scope="module")
+def bash_session(tempdir: Path) -> Iterator[BashSession]:
+    """
+    Return a :class:`BashSession` for the console code blocks of the current document.
+
+    The session is started in the :func:`tempdir()`.
+    """
+    session = BashSession()
     try:
-        with pytest.MonkeyPatch.context() as monkeypatch:
-            monkeypatch.setitem(os.environ, "PATH", path)
-            yield tmp_path
+        yield session
     finally:
-        os.chdir(old_cwd)
+        session.close()
 
 
 class Env:
@@ -161,13 +366,20 @@ class Env:
     """
 
     def __init__(self) -> None:
-        self._mp = pytest.MonkeyPatch()
+        # Original values of all changed vars ("None" if a var did not exist):
+        self._saved: Dict[str, Optional[str]] = {}
 
     def set(self, name: str, value: str) -> None:
-        self._mp.setenv(name, value)
+        self._saved.setdefault(name, os.environ.get(name))
+        os.environ[name] = value
 
     def undo(self) -> None:
-        self._mp.undo()
+        for name, value in self._saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        self._saved.clear()
 
 
 @pytest.fixture(scope="module")
@@ -199,7 +411,7 @@ markdown_examples = sybil.Sybil(
         sybil.parsers.myst.SkipParser(),
     ],
     patterns=["*.md"],
-    fixtures=["tempdir", "env", "tmp_path"],
+    fixtures=["tempdir", "env", "tmp_path", "bash_session"],
 )
 rest_examples = sybil.Sybil(
     parsers=[
@@ -208,4 +420,37 @@ rest_examples = sybil.Sybil(
     ],
     patterns=["*.py"],
 )
-pytest_collect_file = (markdown_examples + rest_examples).pytest()
+_collect_sybil_file = (markdown_examples + rest_examples).pytest()
+
+# Files that contain none of these can't contain any examples:
+EXAMPLE_MARKERS = (b"```", b"~~~", b"code-block", b">>>")
+
+
+def pytest_collect_file(
+    file_path: Path, parent: pytest.Collector
+) -> Optional[pytest.Collector]:
+    """
+    Let Sybil collect all files that may contain examples.
+
+    Many (Python) files that match the Sybil patterns don't contain any examples.  A
+    quick check for a few markers is a lot cheaper than letting all parsers lex them.
+    """
+    if not (
+        markdown_examples.should_parse(file_path)
+        or rest_examples.should_parse(file_path)
+    ):
+        return None
+    if not _may_contain_examples(file_path):
+        return None
+    return _collect_sybil_file(file_path, parent)
+
+
+def _may_contain_examples(file_path: Path) -> bool:
+    """
+    Return whether *file_path* contains any of the :data:`EXAMPLE_MARKERS`.
+    """
+    with file_path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return any(data.find(marker) != -1 for marker in EXAMPLE_MARKERS)
@@ -2,9 +2,15 @@
 Configuration and tasks for **Nox**.
 """
 
-import glob
+import functools
+import hashlib
+import json
 import os
 import pathlib
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
 
 
 try:
@@ -13,9 +19,15 @@ except ImportError:
     import tomli as tomllib  # type: ignore[no-redef]
 
 import nox
-from packaging.requirements import Requirement
 
 
+# "default=False" for sessions requires nox 2024.03.02:
+nox.needs_version = ">=2024.3.2"
+
+# Use "uv" to create the venvs and install packages if it is available.
+# Its resolver and cache are a lot faster than pip's, which all sessions benefit from.
+nox.options.default_venv_backend = "uv|virtualenv"
+
 PROJECT_DIR = pathlib.Path(__file__).parent
 MYPY_PATHS = [
     [
@@ -32,6 +44,19 @@ MYPY_PATHS = [
     ],
 ]
 LINT_PATHS = [p for paths in MYPY_PATHS for p in paths]
+# Files and directories that end up in the sdist/wheel (see "pyproject.toml"):
+BUILD_INPUTS = [
+    "pyproject.toml",
+    "README.md",
+    "CHANGELOG.md",
+    "LICENSE",
+    "docs",
+    "src",
+    "tests",
+]
+BUILD_IGNORE = {"__pycache__", "_build", ".mypy_cache", ".pytest_cache"}
+BUILD_STAMP = "dist/.build-stamp"
+CHECKED_WHEELS_STAMP = ".nox/.checked-wheels"
 # Dependencies for which to test against multiple versions
 PYTHON_VERSIONS = ["3.8", "3.9", "3.10", "3.11", "3.12"]
 LATEST_STABLE_PYTHON = PYTHON_VERSIONS[-1]
@@ -54,15 +79,170 @@ if IN_CI:
     ]
 
 
+@functools.lru_cache(maxsize=1)
+def load_pyproject() -> Dict[str, Any]:
+    """
+    Load and return :file:`pyproject.toml` (or an empty dict if it does not exist).
+    """
+    try:
+        return tomllib.loads(PROJECT_DIR.joinpath("pyproject.toml").read_text())
+    except FileNotFoundError:
+        return {}
+
+
+@functools.lru_cache(maxsize=1)
+def get_min_deps() -> Tuple[str, ...]:
+    """
+    Extract the minium versions of the dependencies in the :data:`DEPS_MATRIX` from
+    :file:`pyproject.toml` and return pinned requirements for them.
+
+    This is only computed once (and only when needed), not for every parametrized
+    "test" session.
+    """
+    # Only import "packaging" when it's actually needed (and not for "nox --list"):
+    from packaging.requirements import Requirement
+
+    deps = load_pyproject().get("project", {}).get("dependencies", [])
+    install_deps = []
+    for dep in deps:
+        req = Requirement(dep)
+        if req.name not in DEPS_MATRIX:
+            continue
+        spec = str(req.specifier)
+        assert spec.startswith(">="), spec
+        spec = spec.replace(">=", "==")
+        install_deps.append(f"{req.name}{spec}")
+    return tuple(install_deps)
+
+
+@functools.lru_cache(maxsize=None)
+def list_dist() -> Dict[str, List[str]]:
+    """
+    Return the paths of the wheels and sdists in :file:`dist/`, keyed by format.
+
+    The result is cached until :func:`build()` changes the contents of :file:`dist/`.
+    """
+    dists: Dict[str, List[str]] = {"whl": [], "tar.gz": []}
+    try:
+        entries = os.scandir("dist")
+    except FileNotFoundError:
+        return dists
+    with entries:
+        for entry in entries:
+            if entry.name.endswith(".whl"):
+                dists["whl"].append(entry.path)
+            elif entry.name.endswith(".tar.gz"):
+                dists["tar.gz"].append(entry.path)
+    return dists
+
+
+def list_build_inputs() -> List[str]:
+    """
+    Return the paths of all files in :data:`BUILD_INPUTS` in a stable order.
+    """
+    files = []
+    todo = [str(PROJECT_DIR.joinpath(p)) for p in reversed(BUILD_INPUTS)]
+    while todo:
+        path = todo.pop()
+        try:
+            entries = sorted(os.scandir(path), key=lambda e: e.name)
+        except NotADirectoryError:
+            files.append(path)
+            continue
+        except FileNotFoundError:
+            continue
+        for entry in reversed(entries):
+            if entry.name in BUILD_IGNORE or entry.name.endswith(".pyc"):
+                continue
+            if entry.is_dir():
+                todo.append(entry.path)
+            else:
+                files.append(entry.path)
+    return files
+
+
+def hash_file(path: str) -> bytes:
+    """
+    Return the SHA256 digest of the file *path*.
+    """
+    with open(path, "rb") as f:
+        if sys.version_info >= (3, 11):
+            return hashlib.file_digest(f, "sha256").digest()
+        return hashlib.sha256(f.read()).digest()
+
+
+def get_build_stamp() -> str:
+    """
+    Return a hash over the paths and contents of all :data:`BUILD_INPUTS`.
+
+    The files are hashed in parallel (hashlib releases the GIL while hashing).
+    """
+    files = list_build_inputs()
+    with ThreadPoolExecutor() as executor:
+        digests = executor.map(hash_file, files)
+        stamp = hashlib.sha256()
+        for path, digest in zip(files, digests):
+            # Relative paths, so that the stamp doesn't depend on the checkout location:
+            stamp.update(os.path.relpath(path, PROJECT_DIR).encode())
+            stamp.update(digest)
+    return stamp.hexdigest()
+
+
+def is_build_current(stamp: str) -> bool:
+    """
+    Return whether :file:`dist/` contains packages that were built from sources with
+    the build stamp *stamp*.
+    """
+    dists = list_dist()
+    return bool(
+        dists["whl"]
+        and dists["tar.gz"]
+        and os.path.isfile(BUILD_STAMP)
+        and pathlib.Path(BUILD_STAMP).read_text() == stamp
+    )
+
+
 @nox.session
 def build(session: nox.Session) -> None:
     """
     Build an sdist and a wheel for TS.
+
+    Nothing is done if :file:`dist/` contains packages built from the current sources.
     """
+    stamp = get_build_stamp()
+    if is_build_current(stamp):
+        session.log("Sources unchanged, using cached packages in dist/")
+        return
+
     session.install("hatch", "check-wheel-contents")
-    session.run("rm", "-rf", "build", "dist", external=True)
-    session.run("hatch", "build")  # , external=True)
-    session.run("check-wheel-contents", *glob.glob("dist/*.whl"))
+    try:
+        session.run("rm", "-rf", "build", "dist", external=True)
+        session.run("hatch", "build")  # , external=True)
+    finally:
+        list_dist.cache_clear()
+    check_wheels(session)
+    pathlib.Path(BUILD_STAMP).write_text(stamp)
+
+
+def check_wheels(session: nox.Session) -> None:
+    """
+    Run "check-wheel-contents" for all wheels in :file:`dist/` that have not yet been
+    checked.
+
+    Hatch builds reproducible wheels, so the wheel's hash only changes if its contents
+    change.  The hashes of checked wheels are stored outside :file:`dist/` because that
+    dir is wiped before each build.
+    """
+    stamp_file = pathlib.Path(CHECKED_WHEELS_STAMP)
+    checked = set(stamp_file.read_text().split()) if stamp_file.is_file() else set()
+    wheels = {hash_file(whl).hex(): whl for whl in list_dist()["whl"]}
+    unchecked = [whl for digest, whl in wheels.items() if digest not in checked]
+    if not unchecked:
+        session.log("Wheel contents unchanged, skipping check-wheel-contents")
+        return
+    session.run("check-wheel-contents", *unchecked)
+    stamp_file.parent.mkdir(parents=True, exist_ok=True)
+    stamp_file.write_text("\n".join(sorted(wheels)))
 
 
 @nox.session(python=PYTHON_VERSIONS, tags=["test"])
@@ -85,31 +265,16 @@ def test(session: nox.Session, deps_min_version: bool, pkg_format: str) -> None:
         if pkg_format != "whl" or deps_min_version:
             session.skip(f"Skipping this session for Python {session.python}")
 
-    pkgs = glob.glob(f"dist/*.{pkg_format}")
-    if len(pkgs) == 0:
-        session.log('Package not found, running "build" ...')
-        build(session)
-        pkgs = glob.glob(f"dist/*.{pkg_format}")
+    # Don't rebuild the packages here: they must not change while they are tested, and
+    # parallel test sessions would race to build them.
+    if not is_build_current(get_build_stamp()):
+        session.error('Package not found or outdated, run "nox -e build" first')
+    pkgs = list_dist()[pkg_format]
     if len(pkgs) != 1:
         session.error(f"Expected exactly 1 file: {', '.join(pkgs)}")
     src = pkgs[0]
 
-    # If testing against the minium versions of our dependencies,
-    # extract their minium version from pyproject.toml and pin
-    # these versions.
-    install_deps = []
-    if deps_min_version:
-        pyproject = tomllib.loads(PROJECT_DIR.joinpath("pyproject.toml").read_text())
-        deps = pyproject["project"]["dependencies"]
-        for dep in deps:
-            req = Requirement(dep)
-            if req.name not in DEPS_MATRIX:
-                continue
-            spec = str(req.specifier)
-            assert spec.startswith(">="), spec
-            spec = spec.replace(">=", "==")
-            install_deps.append(f"{req.name}{spec}")
-
+    install_deps = get_min_deps() if deps_min_version else ()
     session.install(f"typed-settings[test] @ {src}", *install_deps)
 
     # We have to run the tests for the doctests in "src" separately or we'll
@@ -124,12 +289,61 @@ def test(session: nox.Session, deps_min_version: bool, pkg_format: str) -> None:
     session.run("coverage", "run", "-m", "pytest", "src")
 
 
+@nox.session(name="parallel-test", python=False, default=False)
+def parallel_test(session: nox.Session) -> None:
+    """
+    Run all "test" sessions in parallel, each one in its own nox process.
+
+    Pass session names (e.g., "test-3.12(whl, latest_deps_version)") as positional
+    arguments to only run these.  The output of each session is written to
+    :file:`.nox/logs/{session}.log`.
+    """
+    nox_cmd = [sys.executable, "-m", "nox"]
+    names = session.posargs
+    if not names:
+        sessions = json.loads(
+            subprocess.run(  # noqa: S603
+                [*nox_cmd, "--list", "--json"],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+        )
+        names = [s["session"] for s in sessions if s["name"] == "test"]
+
+    # Build the packages once upfront, so that the sessions don't race to build them:
+    session.run(*nox_cmd, "--session", "build", external=True)
+
+    log_dir = PROJECT_DIR.joinpath(".nox", "logs")
+    log_dir.mkdir(parents=True, exist_ok=True)
+
+    def run(name: str) -> int:
+        with log_dir.joinpath(f"{name}.log").open("w") as log:
+            return subprocess.run(  # noqa: S603
+                [*nox_cmd, "--session", name],
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                check=False,
+            ).returncode
+
+    # The real work happens in the child processes, so threads are sufficient here.
+    # Coverage uses "parallel = true", so each process writes its own data file.
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = dict(zip(names, executor.map(run, names)))
+
+    failed = [name for name, returncode in results.items() if returncode != 0]
+    for name in names:
+        session.log(f"{name}: {'failed' if name in failed else 'success'}")
+    if failed:
+        session.error(f"{len(failed)} of {len(names)} sessions failed, see {log_dir}")
+
+
 @nox.session(tags=["test"])
 def test_no_optionals(session: nox.Session) -> None:
     """
     Run tests with no optional dependencies installed.
     """
-    pkgs = glob.glob("dist/*.whl")
+    pkgs = list_dist()["whl"]
     session.install(f"typed-settings @ {pkgs[0]}", "coverage", "pytest", "sybil")
     session.run("coverage", "run", "-m", "pytest", "tests/test_no_optionals.py")
 
@@ -175,6 +389,7 @@ def mypy(session: nox.Session) -> None:
     Run type checking with MyPy.
     """
     session.install("typed-settings[dev] @ .")
+    # Nox sessions are not thread-safe, so the groups are checked one after another:
     for paths in MYPY_PATHS:
         session.run("mypy", "--show-error-codes", *paths)
 
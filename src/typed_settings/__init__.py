@@ -2,40 +2,66 @@
 Core functions for loading and working with settings.
 """
 
-from typing import Any, List
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
 from ._core import SettingsState, convert, default_loaders, load, load_settings
 from ._file_utils import find
-from .cli_argparse import cli
 from .cls_utils import resolve_types
 from .converters import default_converter, register_strlist_hook
 from .loaders import EnvLoader, FileLoader, TomlFormat
 from .types import Secret, SecretStr
 
 
+if TYPE_CHECKING:
+    from .cli_argparse import cli
+    from .cli_click import click_options, pass_settings
+
+
 _attrs_imports = {"combine", "evolve", "option", "secret", "settings"}
-_click_imports = {"click_options", "pass_settings"}
+_click_imports = {"click_options", "pass_settings", "cli_click"}
+# The CLI modules are only imported when they are actually used.  This makes importing
+# "typed_settings" faster, because click (and argparse) are not loaded unless needed.
+_lazy_imports = {
+    "cli": ".cli_argparse",
+    "click_options": ".cli_click",
+    "pass_settings": ".cli_click",
+}
+_lazy_modules = {"cli_argparse", "cli_click"}
 
 try:
     from .cls_attrs import combine, evolve, option, secret, settings
 except ImportError:
     pass
 
-try:
-    from .cli_click import click_options, pass_settings
-except ImportError:
-    pass
-
 
 def __getattr__(name: str) -> Any:
     """
-    Raise a helpful :exc:`ModuleNotFound` error when getting something that requires an
-    optional dependency that is not installed.
+    Lazily import the CLI functions and raise a helpful :exc:`ModuleNotFound` error
+    when getting something that requires an optional dependency that is not installed.
     """
     # This method is only invoked if either
+    # - a lazy import (or CLI module) is requested for the first time,
     # - attrs/click is not installed or
     # - an attribute that actually doesn't exist
     # is requested.
+    if name in _lazy_modules:
+        # Importing a submodule also sets it as attribute of this package:
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ImportError:
+            pass
+
+    if name in _lazy_imports:
+        try:
+            module = importlib.import_module(_lazy_imports[name], __name__)
+        except ImportError:
+            pass
+        else:
+            value = getattr(module, name)
+            globals()[name] = value
+            return value
+
     if name in _attrs_imports:
         raise ModuleNotFoundError(
             "Module 'attrs' not installed.  Please run "
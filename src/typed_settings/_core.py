@@ -411,7 +411,7 @@ def convert(
                     continue
         else:
             converted_value = value
-        dict_utils.set_path(settings_dict, path, converted_value)
+        dict_utils.set_path(settings_dict, oinfo.parts, converted_value)
         loaded_settings_paths.add(path)
 
     for option_info in state.options:
@@ -9,6 +9,7 @@ import itertools
 from datetime import date, datetime, timedelta
 from enum import Enum
 from functools import partial, wraps
+from operator import attrgetter
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -192,7 +193,7 @@ class ArgparseHandler:
             kwargs["default"] = default
         elif is_optional:
             kwargs["default"] = None
-        if type and issubclass(type, bool):
+        if type is bool:  # "bool" cannot be subclassed
             kwargs["action"] = BooleanOptionalAction
 
         return kwargs
@@ -245,6 +246,10 @@ class ArgparseHandler:
         return kwargs
 
 
+# Stateless, so it can be shared (the same goes for "cli_click"):
+_DEFAULT_TYPE_ARGS_MAKER = TypeArgsMaker(ArgparseHandler())
+
+
 def cli(
     settings_cls: Type[ST],
     loaders: Union[str, Sequence[Loader]],
@@ -314,7 +319,7 @@ def cli(
         loaders = _core.default_loaders(loaders)
     converter = converter or converters.default_converter()
     state = _core.SettingsState(settings_cls, loaders, processors, converter, base_dir)
-    type_args_maker = type_args_maker or TypeArgsMaker(ArgparseHandler())
+    type_args_maker = type_args_maker or _DEFAULT_TYPE_ARGS_MAKER
 
     decorator = _get_decorator(state, type_args_maker, **parser_kwargs)
     return decorator
@@ -379,7 +384,7 @@ def make_parser(
         loaders = _core.default_loaders(loaders)
     converter = converter or converters.default_converter()
     state = _core.SettingsState(settings_cls, loaders, processors, converter, base_dir)
-    type_args_maker = type_args_maker or TypeArgsMaker(ArgparseHandler())
+    type_args_maker = type_args_maker or _DEFAULT_TYPE_ARGS_MAKER
 
     return _mk_parser(state, type_args_maker, **parser_kwargs)
 
@@ -440,16 +445,36 @@ def _get_decorator(
         - parses the command line options
         - passes the updated settings instance to the decorated function
         """
+        kwargs = parser_kwargs
+        if "description" not in kwargs and func.__doc__:
+            kwargs = {**kwargs, "description": func.__doc__.strip()}
+
+        # The loaded settings are the only input for the parser that may change
+        # between invocations (they are the options' defaults), so we can reuse the
+        # parser as long as they don't change:
+        cached_settings: Optional[MergedSettings] = None
+        cached_parser: Optional[argparse.ArgumentParser] = None
+        # Without any loaders and processors, only the options' defaults are loaded and
+        # they can't change:
+        only_defaults = not state.loaders and not state.processors
 
         @wraps(func)
         def cli_wrapper() -> Optional[int]:
-            if "description" not in parser_kwargs and func.__doc__:
-                parser_kwargs["description"] = func.__doc__.strip()
-            parser, merged_settings = _mk_parser(
-                state, type_args_maker, **parser_kwargs
-            )
+            nonlocal cached_settings, cached_parser
+            if only_defaults and cached_settings is not None:
+                merged_settings = dict(cached_settings)
+            else:
+                merged_settings = _core._load_settings(state)
+            if cached_parser is None or not _same_settings(
+                merged_settings, cached_settings
+            ):
+                cached_parser = _build_parser(
+                    state, merged_settings, type_args_maker, **kwargs
+                )
+                # "_ns2settings()" modifies "merged_settings", so we need a copy:
+                cached_settings = dict(merged_settings)
 
-            args = parser.parse_args()
+            args = cached_parser.parse_args()
             settings = _ns2settings(args, state, merged_settings)
             return func(settings)
 
@@ -458,6 +483,36 @@ def _get_decorator(
     return decorator
 
 
+def _same_settings(a: MergedSettings, b: Optional[MergedSettings]) -> bool:
+    """
+    Return whether the merged settings *a* and *b* contain the same values.
+
+    Values of different types are not the same, even if they compare equal (e.g.,
+    ``1`` and ``True``), because they may lead to different help texts.
+    """
+    if b is None or a.keys() != b.keys():
+        return False
+    return all(
+        a[path].loader_meta == b[path].loader_meta
+        and _same_value(a[path].value, b[path].value)
+        for path in a
+    )
+
+
+def _same_value(a: Any, b: Any) -> bool:
+    """
+    Return whether *a* and *b* are equal and have the same types (recursively for
+    lists, tuples, and dicts).
+    """
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(map(_same_value, a, b))
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(_same_value(a[k], b[k]) for k in a)
+    return bool(a == b)
+
+
 def _mk_parser(
     state: _core.SettingsState[ST],
     type_args_maker: TypeArgsMaker,
@@ -467,20 +522,30 @@ def _mk_parser(
     Create an :class:`argparse.ArgumentParser` for all options.
     """
     merged_settings = _core._load_settings(state)
-    grouped_options = [
-        (g_cls, list(g_opts))
-        for g_cls, g_opts in itertools.groupby(
-            state.options, key=lambda o: o.parent_cls
-        )
-    ]
+    parser = _build_parser(state, merged_settings, type_args_maker, **parser_kwargs)
+    return (parser, merged_settings)
+
+
+def _build_parser(
+    state: _core.SettingsState[ST],
+    merged_settings: MergedSettings,
+    type_args_maker: TypeArgsMaker,
+    **parser_kwargs: Any,
+) -> argparse.ArgumentParser:
+    """
+    Create an :class:`argparse.ArgumentParser` for all options and use the
+    *merged_settings* as defaults.
+    """
+    converter = state.converter
     parser = argparse.ArgumentParser(**parser_kwargs)
+    grouped_options = itertools.groupby(state.options, key=attrgetter("parent_cls"))
     for g_cls, g_opts in grouped_options:
         group = parser.add_argument_group(g_cls.__name__, f"{g_cls.__name__} options")
         for oinfo in g_opts:
-            default = get_default(oinfo, merged_settings, state.converter)
+            default = get_default(oinfo, merged_settings, converter)
             flags, cfg = _mk_argument(oinfo, default, type_args_maker)
             group.add_argument(*flags, **cfg)
-    return (parser, merged_settings)
+    return parser
 
 
 def _mk_argument(
@@ -543,14 +608,16 @@ def _ns2settings(
     class and return it.
     """
     meta = LoaderMeta("Command line args")
+    # Plain dict lookups are cheaper than "hasattr()" + "getattr()" on the namespace:
+    values = vars(namespace)
     for option_info in state.options:
         path = option_info.path
         attr = path.replace(".", "_")
-        if hasattr(namespace, attr):  # pragma: no cover
+        if attr in values:  # pragma: no cover
             # "path" *should* always be in "cli_options", b/c we *currently*
             # generate CLI options for all options.  But let's stay safe here
             # in case the behavior changes in the future.
-            value = getattr(namespace, attr)
+            value = values[attr]
             if value is not DEFAULT_SENTINEL:
                 merged_settings[path] = LoadedValue(value, meta)
     settings = _core.convert(merged_settings, state)
@@ -585,6 +652,7 @@ class BooleanOptionalAction(argparse.Action):
             option_string = "--no-" + option_string[2:]
             _option_strings.append(option_string)
 
+        self._negative_option_strings = frozenset(_option_strings[1::2])
         super().__init__(
             option_strings=_option_strings,
             dest=dest,
@@ -604,8 +672,10 @@ class BooleanOptionalAction(argparse.Action):
         values: Union[str, Sequence[Any], None],
         option_string: Optional[str] = None,
     ) -> None:
-        if option_string and option_string in self.option_strings:  # pragma: no cover
-            setattr(namespace, self.dest, not option_string.startswith("--no-"))
+        # argparse only passes the (full) option strings registered for this action:
+        if option_string:  # pragma: no cover
+            value = option_string not in self._negative_option_strings
+            setattr(namespace, self.dest, value)
 
     def format_usage(self) -> str:
         return " | ".join(self.option_strings)
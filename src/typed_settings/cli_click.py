@@ -185,7 +185,7 @@ def click_options(
     state = _core.SettingsState(settings_cls, loaders, processors, converter, base_dir)
     grouped_options = cls_utils.group_options(state.settings_class, state.options)
     merged_settings = _core._load_settings(state)
-    type_args_maker = type_args_maker or TypeArgsMaker(ClickHandler())
+    type_args_maker = type_args_maker or _DEFAULT_TYPE_ARGS_MAKER
     decorator_factory = decorator_factory or ClickOptionFactory()
 
     wrapper = _get_wrapper(
@@ -249,23 +249,33 @@ def _get_wrapper(  # noqa: C901
 
         return cast(F, update_wrapper(new_func, f))
 
-    def wrap(f: F) -> F:
-        """
-        The wrapper that actually decorates a function with all options.
-        """
-        option_decorator = decorator_factory.get_option_decorator()
-        for g_cls, g_opts in reversed(grouped_options):
-            for oinfo in reversed(g_opts):
-                default = get_default(oinfo, merged_settings, state.converter)
-                envvar = env_loader.get_envvar(oinfo) if env_loader else None
-                option = _mk_option(
+    # Create the option decorators only once and not each time "wrap()" is called.
+    # Group decorators may hold state, so they are created on demand in "wrap()".
+    option_decorator = decorator_factory.get_option_decorator()
+    option_groups: List[Tuple[type, List[Decorator[Any]]]] = []
+    for g_cls, g_opts in reversed(grouped_options):
+        options = []
+        for oinfo in reversed(g_opts):
+            default = get_default(oinfo, merged_settings, state.converter)
+            envvar = env_loader.get_envvar(oinfo) if env_loader else None
+            options.append(
+                _mk_option(
                     option_decorator,  # type: ignore[arg-type]
                     oinfo,
                     default,
                     type_args_maker,
                     envvar,
                 )
-                f = option(f)  # type: ignore[assignment,arg-type]
+            )
+        option_groups.append((g_cls, options))
+
+    def wrap(f: F) -> F:
+        """
+        The wrapper that actually decorates a function with all options.
+        """
+        for g_cls, options in option_groups:
+            for option in options:
+                f = option(f)
             f = decorator_factory.get_group_decorator(g_cls)(
                 f  # type: ignore[arg-type]
             )
@@ -621,6 +631,9 @@ class ClickHandler:
         return kwargs
 
 
+_DEFAULT_TYPE_ARGS_MAKER = TypeArgsMaker(ClickHandler())
+
+
 def _mk_option(
     option_fn: Callable[..., Decorator[F]],
     oinfo: OptionInfo,
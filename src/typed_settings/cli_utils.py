@@ -64,6 +64,17 @@ DEFAULT_SENTINEL = object()
 DEFAULT_SENTINEL_NAME = "DEFAULT_SENTINEL"
 
 
+def _dynamic_default() -> object:
+    """
+    Fake factory function that indicates a dynamic default value, that is only
+    computed when the CLI is invoked (and not when the options are generated).
+    """
+    return None
+
+
+_dynamic_default.__name__ = DEFAULT_SENTINEL_NAME
+
+
 Default = Union[Any, None, NoDefaultType]
 NoneType = type(None)
 StrDict = Dict[str, Any]
@@ -304,11 +315,13 @@ class TypeArgsMaker:
             return self._handle_scalar(otype, default, is_optional)
 
         elif origin is None:
+            while types.is_new_type(otype):
+                otype = otype.__supertype__
             scalar_handlers = self.type_handler.get_scalar_handlers()
+            # Check the handlers in order (e.g., user handlers may come first).  The
+            # identity check avoids "issubclass()" for types with their own handler:
             for target_type, get_kwargs in scalar_handlers.items():
-                if types.is_new_type(otype):
-                    otype = otype.__supertype__
-                if issubclass(otype, target_type):
+                if otype is target_type or issubclass(otype, target_type):
                     return get_kwargs(otype, default, is_optional)
 
             return self._handle_scalar(otype, default, is_optional)
@@ -438,12 +451,7 @@ def get_default(
                 ) from e
 
     elif option_info.default_is_factory:
-        # Use a fake factory function to indicate a dynamic default value, that is only
-        # computed when the CLI is invoked (and not when the options are generated).
-        def default() -> object:
-            return None
-
-        default.__name__ = DEFAULT_SENTINEL_NAME
+        default = _dynamic_default
     elif option_info.has_no_default:
         default = NO_DEFAULT
     else:
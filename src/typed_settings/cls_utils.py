@@ -10,6 +10,7 @@ Supported backends are:
 
 import dataclasses
 import functools
+import weakref
 from itertools import groupby
 from typing import (
     Any,
@@ -375,6 +376,15 @@ CLASS_HANDLERS: List[Type[ClsHandler]] = [
 ]
 
 
+# Cache for "deep_options()".  Settings classes are usually not modified after they
+# have been created, so we don't need to inspect them over and over again.
+# The options are stored as an attribute of each class:  They reference the class
+# (e.g., via "OptionInfo.parent_cls"), so a global mapping would keep all classes
+# alive.  The weak set only tracks the cached classes for "clear_options_cache()".
+_OPTIONS_ATTR = "__typed_settings_options__"
+_OPTIONS_CACHED: "weakref.WeakSet[type]" = weakref.WeakSet()
+
+
 def handler_exists(cls: type) -> bool:
     """
     Check if a class handler for *cls* exist.
@@ -428,9 +438,36 @@ def deep_options(cls: type) -> types.OptionList:
     Raises:
         NameError: if the type annotations can not be resolved.  This is, e.g., the
             case when recursive classes are being used.
+
+    .. versionchanged:: 24.4.0
+       The result is cached per class.  Use :func:`clear_options_cache()` if you
+       modify a class after its options have been retrieved.
     """
+    try:
+        # Use "__dict__" so that subclasses don't get the options of their parent:
+        return cls.__dict__[_OPTIONS_ATTR]
+    except (AttributeError, KeyError):
+        pass
     cls_handler = find_handler(cls)
-    return cls_handler.iter_fields(cls)
+    options = cls_handler.iter_fields(cls)
+    try:
+        setattr(cls, _OPTIONS_ATTR, options)
+        _OPTIONS_CACHED.add(cls)
+    except (AttributeError, TypeError):  # pragma: no cover
+        # "cls" cannot be modified or weakly referenced (and thus, can't be cached)
+        pass
+    return options
+
+
+def clear_options_cache() -> None:
+    """
+    Clear the cache used by :func:`deep_options()`.
+
+    .. versionadded:: 24.4.0
+    """
+    for cls in list(_OPTIONS_CACHED):
+        delattr(cls, _OPTIONS_ATTR)
+    _OPTIONS_CACHED.clear()
 
 
 def group_options(
@@ -468,7 +505,7 @@ def group_options(
         """
         Group by prefix and also return the corresponding group class.
         """
-        basename, *remainder = o.path.split(".")
+        basename, *remainder = o.parts
         prefix = basename if remainder else ""
         return prefix, fields_to_parents[basename]
 
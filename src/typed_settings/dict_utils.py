@@ -2,7 +2,7 @@
 Utility functions for working settings dicts and serilizing nested settings.
 """
 
-from typing import Any, Generator, Sequence, Tuple, get_args
+from typing import Any, Dict, Generator, Sequence, Tuple, Union, get_args
 
 from .cls_utils import deep_options, handler_exists
 from .types import (
@@ -48,7 +48,7 @@ def iter_settings(
     """
     for option in options:
         try:
-            option_value = get_path(dct, option.path)
+            option_value = get_path(dct, option.parts)
 
             if is_mutable_sequence(option_value) and not isinstance(
                 option_value, (str, bytes)
@@ -74,7 +74,7 @@ def iter_settings(
             continue
 
 
-def get_path(dct: SettingsDict, path: str) -> Any:
+def get_path(dct: SettingsDict, path: Union[str, Sequence[str]]) -> Any:
     """
     Performs a nested dict lookup for *path* and returns the result.
 
@@ -85,7 +85,8 @@ def get_path(dct: SettingsDict, path: str) -> Any:
     Args:
         dct: The source dict
         path: The path to look up.  It consists of the dot-separated nested
-          keys.
+          keys.  It can also be a sequence of the already split keys (e.g.,
+          :attr:`.OptionInfo.parts`).
 
     Returns:
         The looked up value.
@@ -94,7 +95,9 @@ def get_path(dct: SettingsDict, path: str) -> Any:
         KeyError: if a key in *path* does not exist.
         IndexError: if a index in *path* is out of range.
     """
-    for part in path.split("."):
+    if isinstance(path, str):
+        path = path.split(".")
+    for part in path:
         if part.isnumeric():
             dct = dct[int(part)]  # type: ignore[index]
         else:
@@ -102,7 +105,7 @@ def get_path(dct: SettingsDict, path: str) -> Any:
     return dct
 
 
-def set_path(dct: SettingsDict, path: str, val: Any) -> None:
+def set_path(dct: SettingsDict, path: Union[str, Sequence[str]], val: Any) -> None:
     """
     Sets a value to a nested dict and automatically creates missing dicts
     should they not exist.
@@ -115,13 +118,17 @@ def set_path(dct: SettingsDict, path: str, val: Any) -> None:
 
     Args:
         dct: The dict that should contain the value
-        path: The (nested) path, a dot-separated concatenation of keys.
+        path: The (nested) path, a dot-separated concatenation of keys.  It can
+          also be a sequence of the already split keys (e.g.,
+          :attr:`.OptionInfo.parts`).
         val: The value to set
 
     Raises:
         IndexError: if a index in *path* is out of range.
     """
-    *parts, key = path.split(".")
+    if isinstance(path, str):
+        path = path.split(".")
+    *parts, key = path
     for part in parts:
         if part.isnumeric():
             dct = dct[int(part)]  # type: ignore[index]
@@ -162,20 +169,52 @@ def merge_settings(
             "nested.x": ("loader b", "test"),
         }
     """
-    rsettings = settings[::-1]
-    merged_settings: MergedSettings = {}
+    # Walk each loaded dict only once (starting with the one with the highest
+    # precedence) and only along the paths of options that are still unresolved:
+    unresolved: Dict[str, Any] = {}
     for option_info in options:
-        for loaded_settings in rsettings:
-            try:
-                value = get_path(loaded_settings.settings, option_info.path)
-            except KeyError:
-                pass
-            else:
-                merged_settings[option_info.path] = LoadedValue(
-                    value, loaded_settings.meta
-                )
-                break
-    return merged_settings
+        *parts, key = option_info.parts
+        node = unresolved
+        for part in parts:
+            node = node.setdefault(part, {})
+        node[key] = option_info.path
+
+    found: MergedSettings = {}
+    for loaded_settings in reversed(settings):
+        if not unresolved:
+            break
+        if not loaded_settings.settings:
+            # Many loaders find nothing (e.g., no env vars or config files):
+            continue
+        _collect_values(loaded_settings.settings, unresolved, loaded_settings, found)
+
+    # Keep the order of "options":
+    return {o.path: found[o.path] for o in options if o.path in found}
+
+
+def _collect_values(
+    dct: SettingsDict,
+    unresolved: Dict[str, Any],
+    loaded_settings: LoadedSettings,
+    found: MergedSettings,
+) -> None:
+    """
+    Look up all *unresolved* option paths in *dct*, store their values in *found*
+    and remove them from *unresolved*.
+    """
+    for key in list(unresolved):
+        try:
+            value = dct[key]
+        except KeyError:
+            continue
+        subtree = unresolved[key]
+        if isinstance(subtree, str):
+            found[subtree] = LoadedValue(value, loaded_settings.meta)
+            del unresolved[key]
+        else:
+            _collect_values(value, subtree, loaded_settings, found)
+            if not subtree:
+                del unresolved[key]
 
 
 def update_settings(
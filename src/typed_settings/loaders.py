@@ -16,19 +16,13 @@ from typing import (
     List,
     Optional,
     Protocol,
+    Tuple,
     Union,
     cast,
 )
 
-from ._compat import PY_311
-
-
-if PY_311:
-    import tomllib
-else:
-    import tomli as tomllib  # type: ignore[no-redef]
-
 from . import cls_utils
+from ._compat import PY_311
 from .dict_utils import set_path
 from .exceptions import (
     ConfigFileLoadError,
@@ -154,7 +148,7 @@ class _DefaultsLoader:
                 # possible.  This is especially required for CLIs if you want to invoke
                 # the same instance multiple times (e.g., in tests).
                 continue
-            set_path(settings, opt.path, opt.default)
+            set_path(settings, opt.parts, opt.default)
 
         return LoadedSettings(settings, LoaderMeta(self, base_dir=self.base_dir))
 
@@ -234,6 +228,12 @@ class EnvLoader:
         nested_delimiter: Delimiter for attribute names of nested classes.
     """
 
+    # Env var names for the most recently loaded options (see "_get_envvars()").
+    # This is a single tuple so that it can be replaced atomically:
+    _envvars_cache: Optional[
+        Tuple[OptionList, Tuple[str, str], List[Tuple[OptionInfo, str]]]
+    ] = None
+
     def __init__(self, prefix: str, nested_delimiter: str = "_") -> None:
         self.prefix = prefix
         self.nested_delimiter = nested_delimiter
@@ -255,11 +255,10 @@ class EnvLoader:
 
         env = os.environ
         values: SettingsDict = {}
-        for o in options:
-            varname = self.get_envvar(o)
+        for o, varname in self._get_envvars(options):
             if varname in env:
                 LOGGER.debug(f"Env var found: {varname}")
-                set_path(values, o.path, env[varname])
+                set_path(values, o.parts, env[varname])
             else:
                 LOGGER.debug(f"Env var not found: {varname}")
 
@@ -271,6 +270,21 @@ class EnvLoader:
         """
         return f"{self.prefix}{option.path.upper().replace('.', self.nested_delimiter)}"
 
+    def _get_envvars(self, options: OptionList) -> List[Tuple[OptionInfo, str]]:
+        """
+        Return a list of *(option, envvar name)* tuples for *options*.
+
+        The names are only computed again if *options* (which are cached per class by
+        :func:`.cls_utils.deep_options()`), the prefix, or the delimiter change.
+        """
+        key = (self.prefix, self.nested_delimiter)
+        cache = self._envvars_cache
+        if cache is not None and cache[0] is options and cache[1] == key:
+            return cache[2]
+        envvars = [(o, self.get_envvar(o)) for o in options]
+        self._envvars_cache = (options, key, envvars)
+        return envvars
+
 
 class FileLoader:
     """
@@ -463,7 +477,7 @@ class PythonFormat:
                 key = f"{o.path.replace('.', '_')}"
                 if key in settings:
                     val = settings.pop(key)
-                    set_path(settings, o.path, val)
+                    set_path(settings, o.parts, val)
         return settings
 
     def _import_module(self, path: Path) -> object:
@@ -509,6 +523,12 @@ class TomlFormat:
             ConfigFileNotFoundError: If *path* does not exist.
             ConfigFileLoadError: If *path* cannot be read/loaded/decoded.
         """
+        # Only import the TOML parser when a TOML file is actually loaded:
+        if PY_311:
+            import tomllib
+        else:
+            import tomli as tomllib  # type: ignore[no-redef]
+
         try:
             with path.open("rb") as f:
                 settings = tomllib.load(f)
@@ -587,7 +607,7 @@ def clean_settings(
         InvalidOptionsError: If invalid settings have been found.
     """
     invalid_paths = []
-    valid_paths = {o.path for o in options}
+    valid_paths = {o.path: o.parts for o in options}
     cleaned: SettingsDict = {}
 
     def _iter_dict(d: SettingsDict, prefix: str) -> None:
@@ -596,7 +616,7 @@ def clean_settings(
             path = f"{prefix}{key}"
 
             if path in valid_paths:
-                set_path(cleaned, path, val)
+                set_path(cleaned, valid_paths[path], val)
                 continue
 
             if isinstance(val, dict):
@@ -128,6 +128,12 @@ class OptionInfo:
 
     name: str = dataclasses.field(init=False)
 
+    parts: Tuple[str, ...] = dataclasses.field(init=False, repr=False, compare=False)
+    """
+    The path split into its parts (computed once, so that walking nested settings dicts
+    does not have to split the path again and again).
+    """
+
     cls: type
     default: Any
     has_no_default: bool
@@ -142,8 +148,9 @@ class OptionInfo:
         return not self.has_no_default
 
     def __post_init__(self) -> None:
-        _prefix, _, name = self.path.rpartition(".")
-        object.__setattr__(self, "name", name)
+        parts = tuple(self.path.split("."))
+        object.__setattr__(self, "name", parts[-1])
+        object.__setattr__(self, "parts", parts)
 
 
 OptionList = Tuple[OptionInfo, ...]
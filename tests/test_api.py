@@ -2,6 +2,8 @@
 Test that all public functions are properly exposed.
 """
 
+import subprocess
+import sys
 from pathlib import Path
 from typing import Type
 
@@ -85,3 +87,17 @@ def test_dir() -> None:
         "secret",
         "settings",
     ]
+
+
+def test_lazy_cli_imports() -> None:
+    """
+    The CLI modules (and thus, click) are only imported when they are used.
+    """
+    code = (
+        "import sys, typed_settings as ts;"
+        "assert 'click' not in sys.modules;"
+        "assert 'typed_settings.cli_argparse' not in sys.modules;"
+        "assert ts.click_options is ts.cli_click.click_options;"
+        "assert ts.cli is ts.cli_argparse.cli"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
@@ -4,17 +4,19 @@ Tests for "typed_settings.argparse_utils".
 
 import sys
 from pathlib import Path
-from typing import Any, Callable, List, TypeVar
+from typing import Any, Callable, Dict, List, Tuple, TypeVar
 
 import attrs
 import pytest
 
 from typed_settings import (
+    _core,
     cli_argparse,
     cli_utils,
     constants,
     default_converter,
     default_loaders,
+    loaders,
     option,
     settings,
 )
@@ -46,6 +48,30 @@ def _invoke(monkeypatch: pytest.MonkeyPatch) -> Invoke:
     return invoke
 
 
+CountCalls = Callable[[Any, str], List[int]]
+
+
+@pytest.fixture(name="count_calls")
+def _count_calls(monkeypatch: pytest.MonkeyPatch) -> CountCalls:
+    """
+    Return a function that wraps *obj.name* and returns a list that gets an item for
+    each call.
+    """
+
+    def count_calls(obj: Any, name: str) -> List[int]:
+        func = getattr(obj, name)
+        calls: List[int] = []
+
+        def counting_func(*args: Any, **kwargs: Any) -> Any:
+            calls.append(1)
+            return func(*args, **kwargs)
+
+        monkeypatch.setattr(obj, name, counting_func)
+        return calls
+
+    return count_calls
+
+
 def test_cli(invoke: Invoke) -> None:
     """
     Basic test "cli()" - simple CLI for a simple settings class.
@@ -78,6 +104,101 @@ def test_cli_explicit_config(invoke: Invoke) -> None:
     invoke(cli, "--o=3")
 
 
+def test_cli_reuse_parser(
+    invoke: Invoke, count_calls: CountCalls, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    The argument parser is only rebuilt when the loaded settings have changed.
+    """
+    calls = count_calls(cli_argparse, "_build_parser")
+
+    @cli_argparse.cli(Settings, "test")
+    def cli(settings: Settings) -> int:
+        return settings.o
+
+    assert invoke(cli, "--o=3") == 3
+    assert invoke(cli, "--o=4") == 4
+    assert len(calls) == 1
+
+    monkeypatch.setenv("TEST_O", "5")
+    assert invoke(cli) == 5
+    assert len(calls) == 2
+
+
+def test_cli_reuse_parser_typed(invoke: Invoke, count_calls: CountCalls) -> None:
+    """
+    The argument parser is rebuilt when a loaded value changes its type, even if the
+    old and new value compare equal (e.g., "1" and "True").
+    """
+    calls = count_calls(cli_argparse, "_build_parser")
+    loader = loaders.DictLoader({"o": 1})
+
+    @cli_argparse.cli(Settings, loaders=[loader])
+    def cli(settings: Settings) -> int:
+        return settings.o
+
+    invoke(cli)
+    loader.settings = {"o": True}
+    invoke(cli)
+    invoke(cli)
+    assert len(calls) == 2
+
+
+def test_cli_reuse_parser_typed_nested(
+    invoke: Invoke, count_calls: CountCalls
+) -> None:
+    """
+    The types of list and dict items are also compared when deciding whether the
+    argument parser can be reused.
+    """
+    calls = count_calls(cli_argparse, "_build_parser")
+
+    @settings
+    class NestedSettings:
+        li: List[int]
+        d: Dict[str, int]
+
+    loader = loaders.DictLoader({"li": [1], "d": {"a": 1}})
+
+    @cli_argparse.cli(NestedSettings, loaders=[loader])
+    def cli(settings: NestedSettings) -> NestedSettings:
+        return settings
+
+    invoke(cli)
+    loader.settings = {"li": [1], "d": {"a": 1}}
+    invoke(cli)
+    assert len(calls) == 1
+
+    loader.settings = {"li": [True], "d": {"a": 1}}
+    invoke(cli)
+    assert len(calls) == 2
+
+    loader.settings = {"li": [True], "d": {"a": True}}
+    invoke(cli)
+    invoke(cli)
+    assert len(calls) == 3
+
+
+def test_cli_only_defaults(invoke: Invoke, count_calls: CountCalls) -> None:
+    """
+    Without loaders and processors, the defaults are only loaded once.
+    """
+    calls = count_calls(_core, "_load_settings")
+
+    @settings
+    class Settings:
+        o: int = 1
+
+    @cli_argparse.cli(Settings, loaders=[])
+    def cli(settings: Settings) -> int:
+        return settings.o
+
+    assert invoke(cli) == 1
+    assert invoke(cli, "--o=3") == 3
+    assert invoke(cli) == 1
+    assert len(calls) == 1
+
+
 def test_cli_desc_from_func(invoke: Invoke, capsys: pytest.CaptureFixture) -> None:
     """
     The CLI function's docstring is used as argparse CLI description.
@@ -152,6 +273,28 @@ def test_manual_parser_explicit_config() -> None:
     assert result == Settings(3)
 
 
+def test_manual_parser_default_type_args_maker() -> None:
+    """
+    The shared default type args maker creates the same parser as an explicitly
+    passed one.
+    """
+
+    @settings
+    class Settings:
+        a: int = 0
+        b: bool = False
+        c: List[str] = option(factory=list)
+        d: Path = Path("spam")
+
+    default_parser, _ = cli_argparse.make_parser(Settings, "test")
+    tam = cli_utils.TypeArgsMaker(cli_argparse.ArgparseHandler())
+    parser, _ = cli_argparse.make_parser(Settings, "test", type_args_maker=tam)
+    assert default_parser.format_help() == parser.format_help()
+
+    args = ["--a", "3", "--b", "--c", "x", "--c", "y", "--d", "eggs"]
+    assert default_parser.parse_args(args) == parser.parse_args(args)
+
+
 def test_invalid_bool_flag() -> None:
     """
     Only "long" boolean flags (--flag) are supported, but not short ones (-f).
@@ -165,6 +308,28 @@ def test_invalid_bool_flag() -> None:
         cli_argparse.make_parser(Settings, "test")
 
 
+@pytest.mark.parametrize(
+    "args, expected",
+    [((), False), (("--no-cache",), True), (("--no-no-cache",), False)],
+)
+def test_bool_flag_with_no_prefix(
+    args: Tuple[str, ...], expected: bool, invoke: Invoke
+) -> None:
+    """
+    Boolean options whose name starts with "no" can be enabled with their flag.
+    """
+
+    @settings
+    class Settings:
+        no_cache: bool = False
+
+    @cli_argparse.cli(Settings, "test")
+    def cli(settings: Settings) -> bool:
+        return settings.no_cache
+
+    assert invoke(cli, *args) is expected
+
+
 def test_attrs_meta_not_modified() -> None:
     """
     The attrs meta data with with user defined argparse config is not modified.
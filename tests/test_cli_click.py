@@ -14,6 +14,7 @@ import pytest
 
 import typed_settings.cli_click as cli_click
 from typed_settings import (
+    cli_utils,
     click_options,
     default_loaders,
     option,
@@ -959,6 +960,66 @@ def test_multiple_invocations(invoke: Invoke) -> None:
     assert loaded_settings == [Settings(3), Settings(0)]
 
 
+def test_reuse_decorator(invoke: Invoke) -> None:
+    """
+    The decorator returned by "click_options()" can be applied to multiple commands.
+    """
+
+    @settings
+    class Settings:
+        o: int = 0
+
+    loaded_settings: List[Settings] = []
+    decorator = click_options(Settings, "example")
+
+    @click.command()
+    @decorator
+    def cli1(settings: Settings) -> None:
+        loaded_settings.append(settings)
+
+    @click.command()
+    @decorator
+    def cli2(settings: Settings) -> None:
+        loaded_settings.append(settings)
+
+    invoke(cli1, "--o=1")
+    invoke(cli2, "--o=2")
+    invoke(cli1)
+    assert loaded_settings == [Settings(1), Settings(2), Settings(0)]
+
+
+def test_default_type_args_maker(invoke: Invoke) -> None:
+    """
+    The shared default type args maker creates the same options as an explicitly
+    passed one.
+    """
+
+    @settings
+    class Settings:
+        a: int = 0
+        b: bool = False
+        c: List[str] = option(factory=list)
+        d: Path = Path("spam")
+
+    tam = cli_utils.TypeArgsMaker(cli_click.ClickHandler())
+    outputs = []
+    for decorator in [
+        click_options(Settings, "test"),
+        click_options(Settings, "test", type_args_maker=tam),
+    ]:
+
+        @click.command(name="cli")
+        @decorator
+        def cli(settings: Settings) -> None:
+            click.echo(repr(settings))
+
+        outputs.append(invoke(cli, "--help").output)
+        outputs.append(invoke(cli, "--a=3", "--b", "--c=x", "--c=y", "--d=eggs").output)
+
+    assert outputs[0] == outputs[2]
+    assert outputs[1] == outputs[3]
+
+
 def test_pydantic_secrets(invoke: Invoke) -> None:
     """
     Tests for pydantic secrets handling together with click.
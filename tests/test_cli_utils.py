@@ -186,6 +186,24 @@ class TestTypeArgsMaker:
             "called": "special",
         }
 
+    def test_handler_order(self) -> None:
+        """
+        The scalar handlers are checked in order.  A handler for a base class (e.g.,
+        from a user) takes precedence over a later handler for the exact type.
+        """
+
+        def handle_user(
+            type: type, default: Any, is_optional: bool
+        ) -> cli_utils.StrDict:
+            return {"called": "user"}
+
+        class UserTypeHandler(TypeHandler):
+            def get_scalar_handlers(self) -> Dict[type, cli_utils.TypeHandlerFunc]:
+                return {int: handle_user, bool: handle_int}
+
+        tam = cli_utils.TypeArgsMaker(UserTypeHandler())
+        assert tam.get_kwargs(bool, False) == {"called": "user"}
+
     @pytest.mark.parametrize("default", ["x", None, cli_utils.NO_DEFAULT])
     @pytest.mark.parametrize("is_optional", [True, False])
     def test_scalar(
@@ -411,6 +429,8 @@ def test_get_default_factory() -> None:
     assert callable(result)
     assert result.__name__ == cli_utils.DEFAULT_SENTINEL_NAME
     assert result() is None
+    # The same marker is used for all options with a default factory:
+    assert cli_utils.get_default(oinfo, {}, default_converter()) is result
 
 
 def test_get_default_cattrs_error() -> None:
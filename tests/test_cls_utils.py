@@ -3,6 +3,8 @@ Tests for "typed_settings.cls_utils".
 """
 
 import dataclasses
+import gc
+import weakref
 from typing import Callable, List, Optional
 
 import attrs
@@ -65,6 +67,44 @@ def test_deep_options(cls: type) -> None:
     )
 
 
+def test_deep_options_cached() -> None:
+    """
+    The options of a class are only computed once, until the cache is cleared.
+    """
+
+    @attrs.define
+    class C:
+        x: int = 0
+
+    option_list = cls_utils.deep_options(C)
+    assert cls_utils.deep_options(C) is option_list
+
+    cls_utils.clear_options_cache()
+    new_option_list = cls_utils.deep_options(C)
+    assert new_option_list is not option_list
+    assert new_option_list == option_list
+
+
+def test_deep_options_cache_no_leak() -> None:
+    """
+    The options cache does not keep classes alive.
+    """
+
+    def make_cls() -> type:
+        @attrs.define
+        class C:
+            x: int = 0
+
+        return C
+
+    cls = make_cls()
+    cls_utils.deep_options(cls)
+    ref = weakref.ref(cls)
+    del cls
+    gc.collect()
+    assert ref() is None
+
+
 def test_deep_options_typerror() -> None:
     """
     A TypeError is raised for non supported classes.
@@ -144,6 +144,19 @@ def test_set_path() -> None:
     }
 
 
+def test_paths_as_parts() -> None:
+    """
+    "get_path()" and "set_path()" also accept paths that are already split into parts.
+    """
+    dct: Dict[str, Any] = {}
+    dict_utils.set_path(dct, ("a", "b"), 1)
+    dict_utils.set_path(dct, ("u",), [None])
+    dict_utils.set_path(dct, ("u", "0"), 2)
+    assert dct == {"a": {"b": 1}, "u": [2]}
+    assert dict_utils.get_path(dct, ("a", "b")) == 1
+    assert dict_utils.get_path(dct, ("u", "0")) == 2
+
+
 def test_merge_settings() -> None:
     """
     When settings are merged, merging only applies to keys for options, not list or
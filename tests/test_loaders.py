@@ -12,6 +12,7 @@ import attrs
 import pytest
 from pytest import MonkeyPatch
 
+from typed_settings._compat import PY_311
 from typed_settings.cls_utils import deep_options
 from typed_settings.exceptions import (
     ConfigFileLoadError,
@@ -28,10 +29,15 @@ from typed_settings.loaders import (
     PythonFormat,
     TomlFormat,
     clean_settings,
-    tomllib,
 )
 from typed_settings.types import LoadedSettings, LoaderMeta, OptionList, SettingsDict
 
+
+if PY_311:
+    import tomllib
+else:
+    import tomli as tomllib  # type: ignore[no-redef]
+
 from .conftest import Host, Settings, SettingsClasses
 
 
@@ -581,6 +587,47 @@ class TestEnvLoader:
         results = loader(Settings, deep_options(Settings))
         assert results == LoadedSettings({"url": "spam"}, LoaderMeta("EnvLoader"))
 
+    def test_envvar_names_cached(self, monkeypatch: MonkeyPatch) -> None:
+        """
+        The env var names are only computed again if the options, the prefix or the
+        delimiter change.
+        """
+        monkeypatch.setenv("T_URL", "foo")
+        monkeypatch.setenv("X_URL", "bar")
+        loader = EnvLoader(prefix="T_")
+        calls: List[str] = []
+        get_envvar = loader.get_envvar
+
+        def counting_get_envvar(option: Any) -> str:
+            calls.append(option.path)
+            return get_envvar(option)
+
+        monkeypatch.setattr(loader, "get_envvar", counting_get_envvar)
+        options = deep_options(Settings)
+
+        loader(Settings, options)
+        assert len(calls) == len(options)
+        assert loader(Settings, options).settings == {"url": "foo"}
+        assert len(calls) == len(options)
+
+        loader.prefix = "X_"
+        assert loader(Settings, options).settings == {"url": "bar"}
+        assert len(calls) == 2 * len(options)
+
+    def test_subclass_without_super_init(self, monkeypatch: MonkeyPatch) -> None:
+        """
+        Subclasses that don't call "super().__init__()" still work.
+        """
+
+        class MyEnvLoader(EnvLoader):
+            def __init__(self) -> None:
+                self.prefix = "T_"
+                self.nested_delimiter = "_"
+
+        monkeypatch.setenv("T_URL", "foo")
+        loader = MyEnvLoader()
+        assert loader(Settings, deep_options(Settings)).settings == {"url": "foo"}
+
     @pytest.mark.parametrize("delimiter", ["_", "__", "#"])
     def test_nested_delimiter(self, delimiter: str, monkeypatch: MonkeyPatch) -> None:
         """
@@ -28,6 +28,7 @@ except ImportError:
         ("attrs", "option"),
         ("attrs", "secret"),
         ("attrs", "settings"),
+        ("click", "cli_click"),
         ("click", "click_options"),
         ("click", "pass_settings"),
     ],